@@ -293,12 +293,14 @@ class BeaconServer(SCIONElement, metaclass=ABCMeta):
         try:
             self.path_policy.check_filters(pcb)
         except SCIONPathPolicyViolated as e:
-            logging.debug("Segment dropped due to path policy: %s\n%s" %
-                          (e, pcb.short_desc()))
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Segment dropped due to path policy: %s\n%s",
+                              e, pcb.short_desc())
             return
         if not self._filter_pcb(pcb):
-            logging.debug("Segment dropped due to looping: %s" %
-                          pcb.short_desc())
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Segment dropped due to looping: %s",
+                              pcb.short_desc())
             return
         seg_meta = PathSegMeta(pcb, self.continue_seg_processing, meta)
         self._process_path_seg(seg_meta, cpld.req_id)
@@ -337,7 +339,7 @@ class BeaconServer(SCIONElement, metaclass=ABCMeta):
 
     def handle_routing_pol_ext(self, ext):
         # TODO(Sezer): Implement routing policy extension handling
-        logging.debug("Routing policy extension: %s" % ext)
+        logging.debug("Routing policy extension: %s", ext)
 
     @abstractmethod
     def register_segments(self):
@@ -606,7 +608,8 @@ class BeaconServer(SCIONElement, metaclass=ABCMeta):
         srev_info = pmgt.union
         rev_info = srev_info.rev_info()
         assert isinstance(rev_info, RevocationInfo), type(rev_info)
-        logging.debug("Received revocation from %s: %s", meta, rev_info.short_desc())
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Received revocation from %s: %s", meta, rev_info.short_desc())
         self.check_revocation(srev_info, lambda x:
                               self._process_revocation(srev_info) if not x else False, meta)
 
@@ -237,10 +237,10 @@ class CertServer(SCIONElement):
                                     pld_packed)
         except ZkNoConnection:
             logging.warning("Unable to store %s in shared path: "
-                            "no connection to ZK" % "TRC" if is_trc else "CC")
+                            "no connection to ZK", "TRC" if is_trc else "CC")
             return
-        logging.debug("%s stored in ZK: %s" % ("TRC" if is_trc else "CC",
-                                               pld_hash))
+        logging.debug("%s stored in ZK: %s", "TRC" if is_trc else "CC",
+                      pld_hash)
 
     def process_cert_chain_request(self, cpld, meta):
         """Process a certificate chain request."""
@@ -155,8 +155,9 @@ class PathSegmentDB(object):
                 self._db.insert(
                     record, record.id, first_ia[0], first_ia[1],
                     last_ia[0], last_ia[1], pcb.is_sibra())
-                logging.debug("Added segment from %s to %s: %s",
-                              first_ia, last_ia, pcb.short_desc())
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("Added segment from %s to %s: %s",
+                                  first_ia, last_ia, pcb.short_desc())
                 if self._labels:
                     SEGS_ADDED.labels(**self._labels).inc()
                     SEGS_TOTAL.labels(**self._labels).inc()
@@ -241,8 +242,9 @@ class PathSegmentDB(object):
         for r in recs:
             if r['record'].exp_time < now:
                 expired.append(r)
-                logging.debug("Path-Segment expired: %s",
-                              r['record'].pcb.short_desc())
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("Path-Segment expired: %s",
+                                  r['record'].pcb.short_desc())
                 continue
             ret.append(r)
         if expired:
@@ -29,6 +29,7 @@ from socket import (
     MSG_DONTWAIT,
     SOCK_DGRAM,
     SOCK_STREAM,
+    SOMAXCONN,
     SOL_SOCKET,
     SO_REUSEADDR,
     socket,
@@ -225,7 +226,7 @@ class ReliableSocket(Socket):
             logging.critical("Error binding to %s: %s", addr, e)
             kill_self()
         os.umask(old_mask)
-        self.sock.listen(5)
+        self.sock.listen(SOMAXCONN)
         if desc:
             logging.debug("%s bound to %s", desc, addr)
 
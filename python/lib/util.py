@@ -255,28 +255,32 @@ def hex_str(raw):
 
 
 def recv_all(sock, total_len, flags):
-    barr = bytearray()
-    while len(barr) < total_len:
+    barr = bytearray(total_len)
+    view = memoryview(barr)
+    read = 0
+    while read < total_len:
         # The first recv call must support non-blocking mode to raise an error
         # if the socket is not ready. Subsequent calls should be blocking to
         # avoid sync problems.
-        if flags & MSG_DONTWAIT and len(barr) > 0:
+        if flags & MSG_DONTWAIT and read > 0:
             flags &= ~MSG_DONTWAIT
         try:
-            buf = sock.recv(total_len - len(barr), flags)
+            # Receive into the preallocated buffer rather than allocating
+            # and concatenating a bytes object per chunk.
+            n = sock.recv_into(view[read:], total_len - read, flags)
         except InterruptedError:
             continue
         except ConnectionResetError:
             # Peer closed the connection without reading
             logging.error("socket closed by peer")
             return None
-        if not buf:
-            if not barr:
+        if not n:
+            if not read:
                 logging.debug("recv returned nil, socket closed")
             else:
                 logging.error("socket connection prematurely terminated")
             return None
-        barr += buf
+        read += n
     return bytes(barr)
 
 
@@ -247,7 +247,8 @@ class PathServer(SCIONElement, metaclass=ABCMeta):
 
         if srev_info in self.revocations:
             return
-        logging.debug("Received revocation from %s: %s", meta, rev_info.short_desc())
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Received revocation from %s: %s", meta, rev_info.short_desc())
         self.check_revocation(srev_info, lambda x: self._continue_revocation_processing(meta,
                               srev_info) if not x else False, meta)
 
@@ -285,9 +286,10 @@ class PathServer(SCIONElement, metaclass=ABCMeta):
             for core_segment in self.core_segments(full=True):
                 core_segs_removed += _handle_one_seg(core_segment, self.core_segments, True)
 
-        logging.debug("Removed segments revoked by [%s]: UP: %d DOWN: %d CORE: %d" %
-                      (rev_info.short_desc(), up_segs_removed, down_segs_removed,
-                       core_segs_removed))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Removed segments revoked by [%s]: UP: %d DOWN: %d CORE: %d",
+                          rev_info.short_desc(), up_segs_removed, down_segs_removed,
+                          core_segs_removed)
 
     @abstractmethod
     def _forward_revocation(self, rev_info, meta):
@@ -400,7 +402,7 @@ class PathServer(SCIONElement, metaclass=ABCMeta):
         The segment is added to pathdb and pending requests are checked.
         """
         pcb = seg_meta.seg
-        logging.debug("Successfully verified PCB %s" % pcb.short_id())
+        logging.debug("Successfully verified PCB %s", pcb.short_id())
         type_ = seg_meta.type
         params = seg_meta.params
         self.handle_ext(pcb)
@@ -419,7 +421,7 @@ class PathServer(SCIONElement, metaclass=ABCMeta):
 
     def handle_routing_pol_ext(self, ext):
         # TODO(Sezer): Implement extension handling
-        logging.debug("Routing policy extension: %s" % ext)
+        logging.debug("Routing policy extension: %s", ext)
 
     def _dispatch_segment_record(self, type_, seg, **kwargs):
         # Check that segment does not contain a revoked interface.
@@ -234,7 +234,9 @@ class CorePathServer(PathServer):
         sflags.add(PATH_FLAG_CACHEONLY)
         flags = tuple(sflags)
         req = PathSegmentReq.from_values(src_ia, dst_ia, flags=flags)
-        logger.debug("Asking master (%s) for segment: %s" % (self._master_id, req.short_desc()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Asking master (%s) for segment: %s",
+                         self._master_id, req.short_desc())
         self._send_to_master(req)
 
     def _propagate_to_core_ases(self, pld):
@@ -393,8 +395,9 @@ class CorePathServer(PathServer):
                 (meta.ia not in self._core_ases[self.addr.isd_as[0]]) or
                 (meta.ia == self.addr.isd_as and
                  rev_isd_as[0] != self.addr.isd_as[0])):
-            logging.debug("Propagating revocation to other cores: %s"
-                          % rev_info.short_desc())
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Propagating revocation to other cores: %s",
+                              rev_info.short_desc())
             self._propagate_to_core_ases(srev_info)
 
     def _init_metrics(self):
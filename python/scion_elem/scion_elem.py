@@ -325,7 +325,7 @@ class SCIONElement(object):
         if not meta:
             logging.error("Couldn't find a CS to request %sv%s TRC" % (isd, ver))
             return
-        logging.debug("Requesting TRC [id: %016x] from %s" % (req_id, meta))
+        logging.debug("Requesting TRC [id: %016x] from %s", req_id, meta)
         self.send_meta(CtrlPayload(CertMgmt(trc_req), req_id=req_id), meta)
 
     def _check_cert_reqs(self):
@@ -353,7 +353,7 @@ class SCIONElement(object):
         if not meta:
             logging.error("Couldn't find a CS to request %sv%s CERTCHAIN" % (isd_as, ver))
             return
-        logging.debug("Requesting CERTCHAIN [id: %016x] from %s" % (req_id, meta))
+        logging.debug("Requesting CERTCHAIN [id: %016x] from %s", req_id, meta)
         self.send_meta(CtrlPayload(CertMgmt(cert_req), req_id=req_id), meta)
 
     def _check_cert_req_states(self):
@@ -395,8 +395,9 @@ class SCIONElement(object):
         """
         meta_str = str(seg_meta.meta) if seg_meta.meta else "ZK"
         req_str = "[id: %016x]" % req_id if req_id else ""
-        logging.debug("Handling PCB from %s: %s %s",
-                      meta_str, seg_meta.seg.short_desc(), req_str)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Handling PCB from %s: %s %s",
+                          meta_str, seg_meta.seg.short_desc(), req_str)
         with self.unv_segs_lock:
             # Close the meta of the previous seg_meta, if there was one.
             prev_meta = self.unverified_segs.get(seg_meta.id)
@@ -472,12 +473,12 @@ class SCIONElement(object):
         with self.req_trcs_lock:
             req_time, _ = self.requested_trcs.get((isd, ver), (None, None))
             if req_time:
-                logging.debug("Request for %sv%s TRC already registered" % (isd, ver))
+                logging.debug("Request for %sv%s TRC already registered", isd, ver)
                 if meta:
                     # There is already an outstanding request for the missing TRC
                     # Update the stored meta with the latest known server that has the TRC.
                     self.requested_trcs[(isd, ver)] = (req_time, meta)
-                    logging.debug("Updated %sv%s TRC meta %s" % (isd, ver, meta))
+                    logging.debug("Updated %sv%s TRC meta %s", isd, ver, meta)
                 return
         trc_req = TRCRequest.from_values(isd, ver)
         req_id = mk_ctrl_req_id()
@@ -503,12 +504,12 @@ class SCIONElement(object):
         with self.req_certs_lock:
             req_time, _ = self.requested_certs.get((isd_as, ver), (None, None))
             if req_time:
-                logging.debug("Request for %sv%s CERTCHAIN already registered" % (isd_as, ver))
+                logging.debug("Request for %sv%s CERTCHAIN already registered", isd_as, ver)
                 if meta:
                     # There is already an outstanding request for the missing cert
                     # Update the stored meta with the latest known server that has the cert.
                     self.requested_certs[(isd_as, ver)] = (req_time, meta)
-                    logging.debug("Updated %sv%s CERTCHAIN meta %s" % (isd_as, ver, meta))
+                    logging.debug("Updated %sv%s CERTCHAIN meta %s", isd_as, ver, meta)
                 return
         cert_req = CertChainRequest.from_values(isd_as, ver)
         req_id = mk_ctrl_req_id()
@@ -1253,7 +1254,8 @@ class SCIONElement(object):
             # return the error to the callback (SCIOND wants it)
             callback(e)
 
-        logging.debug("Successfully validated and verified %s" % srev_info.short_desc())
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Successfully validated and verified %s", srev_info.short_desc())
         # Return a None error to the callback
         callback(None)
 
@@ -1272,8 +1274,9 @@ class SCIONElement(object):
                 srev_info = revocations.get((asm.isd_as(), if_id))
                 if srev_info:
                     rev_info = srev_info.rev_info()
-                    logging.debug("Found revoked interface (%d, %s) in segment %s." %
-                                  (rev_info.p.ifID, rev_info.isd_as(), seg.short_desc()))
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug("Found revoked interface (%d, %s) in segment %s.",
+                                      rev_info.p.ifID, rev_info.isd_as(), seg.short_desc())
                     return False
         return True
 
@@ -1287,6 +1290,6 @@ class SCIONElement(object):
         cert_req = CertRequestState(src, meta)
         with self.cert_reqs_lock:
             self.cert_reqs[(src.ia, src.chain_ver)].append(cert_req)
-            logging.debug("Added CertRequestState for %sv%s from %s" % (src.ia,
-                          src.chain_ver, meta))
+            logging.debug("Added CertRequestState for %sv%s from %s", src.ia,
+                          src.chain_ver, meta)
         return cert_req
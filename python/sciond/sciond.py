@@ -245,7 +245,8 @@ class SCIONDaemon(SCIONElement):
         if self.addr.isd_as != pcb.last_ia():
             return None
         if self.up_segments.update(pcb) == DBResult.ENTRY_ADDED:
-            logging.debug("Up segment added: %s", pcb.short_desc())
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Up segment added: %s", pcb.short_desc())
             return pcb.first_ia()
         return None
 
@@ -254,13 +255,15 @@ class SCIONDaemon(SCIONElement):
         if self.addr.isd_as == last_ia:
             return None
         if self.down_segments.update(pcb) == DBResult.ENTRY_ADDED:
-            logging.debug("Down segment added: %s", pcb.short_desc())
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Down segment added: %s", pcb.short_desc())
             return last_ia
         return None
 
     def _handle_core_seg(self, pcb):
         if self.core_segments.update(pcb) == DBResult.ENTRY_ADDED:
-            logging.debug("Core segment added: %s", pcb.short_desc())
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Core segment added: %s", pcb.short_desc())
             return pcb.first_ia()
         return None
 
@@ -317,8 +320,9 @@ class SCIONDaemon(SCIONElement):
             reply_entry = SCIONDPathReplyEntry.from_values(
                 path_meta, first_hop)
             reply_entries.append(reply_entry)
-        logging.debug("Replying to api request for %s with %d paths:\n%s",
-                      dst_ia, len(paths), "\n".join([p.short_desc() for p in paths]))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Replying to api request for %s with %d paths:\n%s",
+                          dst_ia, len(paths), "\n".join([p.short_desc() for p in paths]))
         self._send_path_reply(req_id, reply_entries, error, meta)
 
     def _send_path_reply(self, req_id, reply_entries, error, meta):
@@ -423,7 +427,8 @@ class SCIONDaemon(SCIONElement):
         srev_info = pmgt.union
         rev_info = srev_info.rev_info()
         assert isinstance(rev_info, RevocationInfo), type(rev_info)
-        logging.debug("Received revocation: %s from %s", srev_info.short_desc(), meta)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Received revocation: %s from %s", srev_info.short_desc(), meta)
         self.check_revocation(srev_info,
                               lambda e: self.process_revocation(e, srev_info, meta, pld), meta)
 
@@ -490,7 +495,8 @@ class SCIONDaemon(SCIONElement):
         for segment in db(full=True):
             for asm in segment.iter_asms():
                 if self._check_revocation_for_asm(rev_info, asm, verify_all=False):
-                    logging.debug("Removing segment: %s" % segment.short_desc())
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug("Removing segment: %s", segment.short_desc())
                     to_remove.append(segment.get_hops_hash())
         return db.delete_all(to_remove)
 
@@ -709,8 +715,9 @@ class SCIONDaemon(SCIONElement):
             log_exception("Error querying path service:")
             return
         req_id = mk_ctrl_req_id()
-        logging.debug("Sending path request (%s) to [%s]:%s [id: %016x]",
-                      req.short_desc(), addr, port, req_id)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Sending path request (%s) to [%s]:%s [id: %016x]",
+                          req.short_desc(), addr, port, req_id)
         meta = self._build_meta(host=addr, port=port)
         self.send_meta(CtrlPayload(PathMgmt(req), req_id=req_id), meta)
 
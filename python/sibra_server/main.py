@@ -160,7 +160,8 @@ class SibraServerBase(SCIONElement):
         if res == DBResult.ENTRY_ADDED:
             logging.info("%s Segment added: %s", name, pcb.short_desc())
         elif res == DBResult.ENTRY_UPDATED:
-            logging.debug("%s Segment updated: %s", name, pcb.short_desc())
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("%s Segment updated: %s", name, pcb.short_desc())
         isd_as = pcb.first_ia()
         if isd_as not in self.dests:
             logging.debug("Found new destination ISD-AS: %s", isd_as)
@@ -266,8 +267,9 @@ class SibraServerBase(SCIONElement):
         steady = SteadyPath(self.addr, self._port, self.sendq, self.signing_key,
                             link_type, link_state, seg, bwsnap)
         self.dests[isd_as][steady.id] = steady
-        logging.debug("Setting up steady path %s -> %s over %s",
-                      self.addr.isd_as, isd_as, seg.short_desc())
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Setting up steady path %s -> %s over %s",
+                          self.addr.isd_as, isd_as, seg.short_desc())
         steady.setup()
 
     def _pick_seg(self, isd_as):
@@ -18,6 +18,7 @@
 # Stdlib
 import builtins
 from signal import SIGINT, SIGQUIT, SIGTERM
+from socket import MSG_DONTWAIT
 from unittest.mock import patch, call, mock_open, MagicMock
 
 # External packages
@@ -46,6 +47,7 @@ from lib.util import (
     load_json_file,
     load_yaml_file,
     read_file,
+    recv_all,
     sleep_interval,
     trace,
     update_dict,
@@ -311,6 +313,64 @@ class TestSignalHandler(object):
         exit.assert_called_once_with(1)
 
 
+class TestRecvAll(object):
+    """
+    Unit tests for lib.util.recv_all
+    """
+    def _mk_sock(self, *chunks):
+        """
+        Build a mock socket whose recv_into writes successive items of
+        `chunks` into the supplied view. Exception classes/instances are
+        raised instead.
+        """
+        sock = MagicMock(spec_set=["recv_into"])
+        items = iter(chunks)
+
+        def recv_into(view, nbytes, flags):
+            item = next(items)
+            if isinstance(item, Exception) or (
+                    isinstance(item, type) and issubclass(item, Exception)):
+                raise item
+            view[:len(item)] = item
+            return len(item)
+        sock.recv_into.side_effect = recv_into
+        return sock
+
+    def test_single(self):
+        sock = self._mk_sock(b"abcd")
+        ntools.eq_(recv_all(sock, 4, 0), b"abcd")
+        ntools.eq_(sock.recv_into.call_count, 1)
+
+    def test_chunked(self):
+        sock = self._mk_sock(b"ab", b"c", b"def")
+        ntools.eq_(recv_all(sock, 6, 0), b"abcdef")
+        sizes = [c[0][1] for c in sock.recv_into.call_args_list]
+        ntools.eq_(sizes, [6, 4, 3])
+
+    def test_dontwait_cleared(self):
+        sock = self._mk_sock(b"ab", b"cd")
+        ntools.eq_(recv_all(sock, 4, MSG_DONTWAIT), b"abcd")
+        flags = [c[0][2] for c in sock.recv_into.call_args_list]
+        ntools.eq_(flags, [MSG_DONTWAIT, 0])
+
+    def test_eof_start(self):
+        sock = self._mk_sock(b"")
+        ntools.assert_is_none(recv_all(sock, 4, 0))
+
+    def test_eof_mid_frame(self):
+        sock = self._mk_sock(b"ab", b"")
+        ntools.assert_is_none(recv_all(sock, 4, 0))
+
+    def test_reset(self):
+        sock = self._mk_sock(b"ab", ConnectionResetError)
+        ntools.assert_is_none(recv_all(sock, 4, 0))
+
+    def test_interrupted(self):
+        sock = self._mk_sock(b"ab", InterruptedError, b"cd")
+        ntools.eq_(recv_all(sock, 4, 0), b"abcd")
+        ntools.eq_(sock.recv_into.call_count, 3)
+
+
 class TestSCIONTimeGetTime(object):
     """
     Unit tests for lib.util.SCIONTime.get_time